@@ -1,13 +1,17 @@
 import csv
+import io
 import logging
 from collections import defaultdict
-from collections.abc import Callable, Iterator, Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from functools import partial
 from http import HTTPStatus
+from itertools import islice
 from json.decoder import JSONDecodeError
 from pathlib import Path
 from typing import Any, Final, NamedTuple
 
 import requests
+from gevent.pool import Pool
 from requests import Response
 
 from rotkehlchen.assets.asset import Asset, CryptoAsset
@@ -24,6 +28,7 @@ from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.fval import FVal
 from rotkehlchen.globaldb.cache import (
+    globaldb_delete_unique_cache_value,
     globaldb_get_unique_cache_value,
     globaldb_set_unique_cache_value,
 )
@@ -33,12 +38,15 @@ from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.types import CacheType, ChainID, ChecksumEvmAddress, FValWithTolerance, Timestamp
 from rotkehlchen.user_messages import MessagesAggregator
 from rotkehlchen.utils.misc import is_production, ts_now
-from rotkehlchen.utils.serialization import jsonloads_dict, rlk_jsondumps
+from rotkehlchen.utils.serialization import jsonloads_dict
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
 SMALLEST_AIRDROP_SIZE: Final = 20900
+CSV_SNIFF_SAMPLE_LINES: Final = 25  # more than the rows csv.Sniffer.has_header() checks
+CSV_DOWNLOAD_CHUNK_SIZE: Final = 65536
+MAX_CONCURRENT_DOWNLOADS: Final = 4  # all files are served by the same host
 AIRDROPS_REPO_BASE: Final = f'https://raw.githubusercontent.com/rotki/data/{"main" if is_production() else "develop"}'  # noqa: E501
 AIRDROPS_INDEX: Final = f'{AIRDROPS_REPO_BASE}/airdrops/index_v1.json'
 ETAG_CACHE_KEY: Final = 'ETag'
@@ -197,61 +205,113 @@ def _maybe_get_updated_file(
         remote_url: str,
         process_response: Callable[[Response, Path], None],
 ) -> Path:
-    """Downloads the file if cached hash is different and returns its path."""
+    """Downloads the file if cached hash is different and returns its path.
+
+    The ETag of the downloaded file is also cached so that, if the file is still present, a
+    new hash in the index only triggers a conditional request and the body is not transferred
+    again if the remote file did not change."""
     data_dir.mkdir(parents=True, exist_ok=True)
     filename = data_dir / f'{name}'
+    etag_key_parts: Final = (CacheType.AIRDROPS_HASH, name, ETAG_CACHE_KEY)
 
     with GlobalDBHandler().conn.read_ctx() as cursor:
-        if (existing_csv_hash := globaldb_get_unique_cache_value(
+        existing_file_hash = globaldb_get_unique_cache_value(
             cursor=cursor,
             key_parts=(CacheType.AIRDROPS_HASH, name),
-        )) != file_hash:
-            log.info(
-                f'Found a new {name} airdrop file hash: {file_hash}. '
-                f'Removing the old file with hash: {existing_csv_hash}, and downloading new one.',
-            )
-            filename.unlink(missing_ok=True)
+        )
+        cached_etag = globaldb_get_unique_cache_value(cursor=cursor, key_parts=etag_key_parts)
 
-    if not filename.is_file():
-        # if not cached, get it from the remote data repo
-        try:
-            response = requests.get(url=remote_url, timeout=(30, 100))  # a large read timeout is necessary because the queried data is quite large  # noqa: E501
-        except requests.exceptions.RequestException as e:
-            raise RemoteError(f'Airdrops CSV request failed due to {e!s}') from e
-        process_response(response, filename)
+    if existing_file_hash == file_hash and filename.is_file():
+        return filename
 
-        with GlobalDBHandler().conn.write_ctx() as write_cursor:
+    log.info(
+        f'Found a new {name} airdrop file hash: {file_hash}. '
+        f'Replacing the old file with hash: {existing_file_hash}.',
+    )
+    headers = {}
+    if cached_etag is not None and filename.is_file():
+        headers['If-None-Match'] = cached_etag.encode('utf-8')
+
+    try:
+        response = requests.get(
+            url=remote_url,
+            timeout=(30, 100),  # a large read timeout is necessary because the queried data is quite large  # noqa: E501
+            headers=headers,
+            stream=True,  # let process_response consume the body in chunks
+        )
+    except requests.exceptions.RequestException as e:
+        raise RemoteError(f'Airdrops CSV request failed due to {e!s}') from e
+
+    try:
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            log.debug(f'Remote {name} airdrop file is not modified. Keeping the local one')
+        else:
+            process_response(response, filename)
+    except requests.exceptions.RequestException as e:  # the body is read while processing
+        raise RemoteError(f'Airdrops file request failed due to {e!s}') from e
+    finally:
+        response.close()
+
+    with GlobalDBHandler().conn.write_ctx() as write_cursor:
+        globaldb_set_unique_cache_value(
+            write_cursor=write_cursor,
+            key_parts=(CacheType.AIRDROPS_HASH, name),
+            value=file_hash,
+        )
+        if (etag := response.headers.get(ETAG_CACHE_KEY)) is not None:
             globaldb_set_unique_cache_value(
                 write_cursor=write_cursor,
-                key_parts=(CacheType.AIRDROPS_HASH, name),
-                value=file_hash,
+                key_parts=etag_key_parts,
+                value=etag,
+            )
+        elif response.status_code != HTTPStatus.NOT_MODIFIED:  # stale etag of the old file
+            globaldb_delete_unique_cache_value(
+                write_cursor=write_cursor,
+                key_parts=etag_key_parts,
             )
 
     return filename
 
 
-def get_airdrop_data(airdrop_data: Airdrop, name: str, data_dir: Path) -> Iterator[list[str]]:
-    """Yields the rows from airdrop's CSV file after downloading it locally for the first time.
-    If a new CSV is found in the index, it will be downloaded again to update the local CSV file
-    and yield new data."""
+def _get_airdrop_file(airdrop_data: Airdrop, name: str, data_dir: Path) -> Path:
+    """Returns the path of the airdrop's CSV file after downloading it locally for the first
+    time. If a new CSV is found in the index, it will be downloaded again to update the local
+    CSV file.
+
+    May raise:
+        - RemoteError if the request fails or the CSV is invalid
+    """
     airdrops_dir = data_dir / APPDIR_NAME / AIRDROPSDIR_NAME
 
     def _process_csv(response: Response, filename: Path) -> None:
+        """Streams the CSV to a temporary file so that the possibly huge body is never kept
+        in memory as a whole. The old file is only replaced if the new one is valid."""
+        tmp_filename = filename.with_name(f'{filename.name}.tmp')
+        sample, size = '', 0
         try:
-            if (
-                not csv.Sniffer().has_header(response.text) or
-                len(response.content) < SMALLEST_AIRDROP_SIZE
-            ):
+            with open(tmp_filename, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=CSV_DOWNLOAD_CHUNK_SIZE):
+                    if size == 0:  # only sniff the first lines, sniffing all of it is slow
+                        sample = ''.join(islice(
+                            io.StringIO(chunk.decode('utf-8', errors='ignore')),
+                            CSV_SNIFF_SAMPLE_LINES,
+                        ))
+                    size += len(chunk)
+                    f.write(chunk)
+
+            if size < SMALLEST_AIRDROP_SIZE or not csv.Sniffer().has_header(sample):
                 raise csv.Error
-            with open(filename, 'w', encoding='utf8') as f:
-                f.write(response.text)
+
+            tmp_filename.replace(filename)
         except csv.Error as e:
-            log.debug(f'airdrop file {filename} contains invalid data {response.text}')
+            log.debug(f'airdrop file {filename} contains invalid data {sample}')
             raise RemoteError(
                 f'File {filename} contains invalid data. Check logs.',
             ) from e
+        finally:  # request errors while streaming are converted by _maybe_get_updated_file
+            tmp_filename.unlink(missing_ok=True)
 
-    filename = _maybe_get_updated_file(
+    return _maybe_get_updated_file(
         data_dir=airdrops_dir,
         file_hash=airdrop_data.csv_hash,
         name=f'{name}.csv',
@@ -259,30 +319,37 @@ def get_airdrop_data(airdrop_data: Airdrop, name: str, data_dir: Path) -> Iterat
         process_response=_process_csv,
     )
 
-    # Verify the CSV file
+
+def _read_airdrop_csv(filename: Path) -> Iterator[list[str]]:
+    """Yields the rows from a downloaded airdrop CSV file, skipping its header"""
     with open(filename, encoding='utf8') as csvfile:
         iterator = csv.reader(csvfile)
         next(iterator)  # skip header
         yield from iterator
 
 
-def get_poap_airdrop_data(airdrop_data: list[str], name: str, data_dir: Path) -> dict[str, Any]:
-    """Returns a dictionary of POAP airdrop data after downloading it locally for the first time.
-    If a new JSON is found in the index, it will be downloaded again to update the local JSON file
-    and return its data."""
+def _get_poap_airdrop_file(airdrop_data: list[str], name: str, data_dir: Path) -> Path:
+    """Returns the path of the POAP airdrop's JSON file after downloading it locally for the
+    first time. If a new JSON is found in the index, it will be downloaded again to update the
+    local JSON file.
+
+    May raise:
+        - RemoteError if the request fails
+    """
     airdrops_dir = data_dir / APPDIR_NAME / AIRDROPSPOAPDIR_NAME
 
     def _process_json(response: Response, filename: Path) -> None:
+        json_text = response.content.decode('utf-8')
         try:
-            json_data = jsonloads_dict(response.content.decode('utf-8'))
+            jsonloads_dict(json_text)  # only validate it, no need to serialize it again
         except JSONDecodeError as e:
             log.error(f"POAP airdrop {name}'s JSON is invalid {e!s}")
-            json_data = {}
+            json_text = '{}'
 
         with open(filename, 'w', encoding='utf8') as outfile:
-            outfile.write(rlk_jsondumps(json_data))
+            outfile.write(json_text)
 
-    filename = _maybe_get_updated_file(
+    return _maybe_get_updated_file(
         data_dir=airdrops_dir,
         file_hash=airdrop_data[3],
         name=f'{name}.json',
@@ -290,7 +357,43 @@ def get_poap_airdrop_data(airdrop_data: list[str], name: str, data_dir: Path) ->
         process_response=_process_json,
     )
 
-    return jsonloads_dict(Path(filename).read_text(encoding='utf8'))
+
+def _download_or_error(download: Callable[[], Path]) -> Path | RemoteError | OSError:
+    """Runs the given download returning the expected errors instead of raising them, so that
+    gevent does not report them as failed greenlets. They are re-raised by _download_files()"""
+    try:
+        return download()
+    except (RemoteError, OSError) as e:
+        return e
+
+
+def _download_files(downloads: Mapping[str, Callable[[], Path]]) -> dict[str, Path]:
+    """Runs the given downloads concurrently since each one is a separate and possibly slow
+    request. Returns the paths of the downloaded files under the keys of the given downloads.
+
+    At most MAX_CONCURRENT_DOWNLOADS requests run at the same time so that the remote host
+    is not hit with all of them at once. The download greenlets never outlive this call,
+    e.g. if the calling task gets killed.
+
+    May raise:
+        - RemoteError if any of the requests fails or any file is invalid
+        - OSError if any of the files could not be written
+    """
+    pool = Pool(size=MAX_CONCURRENT_DOWNLOADS)
+    try:  # spawning waits while the pool is full, so it is also covered by the kill below
+        greenlets = {
+            key: pool.spawn(_download_or_error, download) for key, download in downloads.items()
+        }
+        pool.join(raise_error=True)
+    finally:
+        pool.kill()
+
+    files = {}
+    for key, greenlet in greenlets.items():
+        if isinstance(result := greenlet.value, RemoteError | OSError):
+            raise result
+        files[key] = result
+    return files
 
 
 def calculate_claimed_airdrops(
@@ -335,19 +438,43 @@ def check_airdrops(
         database: DBHandler,
         data_dir: Path,
         tolerance_for_amount_check: FVal = ZERO,
+        current_time: Timestamp | None = None,
 ) -> dict[ChecksumEvmAddress, dict]:
     """Checks airdrop data for the given list of ethereum addresses
 
+    `current_time` is used to skip airdrops past their cutoff time. Defaults to now.
+
     May raise:
         - RemoteError if the remote request fails
     """
     found_data: dict[ChecksumEvmAddress, dict] = defaultdict(lambda: defaultdict(dict))
     airdrop_tuples = []
-    current_time = ts_now()
+    tracked_addresses = set(addresses)  # airdrop files can be huge, so avoid a list scan per row
+    if current_time is None:
+        current_time = ts_now()
     airdrops, poap_airdrops = fetch_airdrops_metadata(database=database)
+    claimable_airdrops = {
+        protocol_name: airdrop_data for protocol_name, airdrop_data in airdrops.items()
+        if airdrop_data.cutoff_time is None or current_time <= airdrop_data.cutoff_time
+    }
+    files = _download_files({
+        f'{protocol_name}.csv': partial(
+            _get_airdrop_file,
+            airdrop_data=airdrop_data,
+            name=protocol_name,
+            data_dir=data_dir,
+        ) for protocol_name, airdrop_data in claimable_airdrops.items()
+    } | {
+        f'{protocol_name}.json': partial(
+            _get_poap_airdrop_file,
+            airdrop_data=poap_airdrop_data,
+            name=protocol_name,
+            data_dir=data_dir,
+        ) for protocol_name, poap_airdrop_data in poap_airdrops.items()
+    })
 
     for protocol_name, airdrop_data in airdrops.items():
-        if airdrop_data.cutoff_time is not None and current_time > airdrop_data.cutoff_time:
+        if protocol_name not in claimable_airdrops:
             log.debug(f'Skipping {protocol_name} airdrop since it is not claimable after {airdrop_data.cutoff_time}')  # noqa: E501
             continue
 
@@ -359,29 +486,35 @@ def check_airdrops(
             claim_event_type = HistoryEventType.RECEIVE
             claim_event_subtype = HistoryEventSubType.AIRDROP
 
+        # amounts of these airdrops are given in wei
+        normalize_amount = protocol_name in {
+            'cornichon',
+            'tornado',
+            'grain',
+            'lido',
+            'sdl',
+            'cow_mainnet',
+            'cow_gnosis',
+        }
         # temporarily store this protocol's data here
         temp_found_data: dict[ChecksumEvmAddress, dict] = defaultdict(lambda: defaultdict(dict))
         temp_airdrop_tuples = []
-        for row in get_airdrop_data(airdrop_data, protocol_name, data_dir):
+        for row in _read_airdrop_csv(files[f'{protocol_name}.csv']):
             if len(row) < 2:
                 msg_aggregator.add_warning(f'Skipping airdrop CSV for {protocol_name} because it contains an invalid row: {row}')  # noqa: E501
                 break
             addr, amount, *_ = row
             # not doing to_checksum_address() here since the file addresses are checksummed
             # and doing to_checksum_address() so many times hits performance
-            if protocol_name in {
-                'cornichon',
-                'tornado',
-                'grain',
-                'lido',
-                'sdl',
-                'cow_mainnet',
-                'cow_gnosis',
-            }:
-                amount = token_normalized_value_decimals(int(amount), 18)  # type: ignore
-            if addr in addresses:
+            if addr in tracked_addresses:
+                # amounts are only converted for the tracked addresses and only once
+                if normalize_amount is True:
+                    amount_value = token_normalized_value_decimals(int(amount), 18)
+                    amount = str(amount_value)
+                else:
+                    amount_value = FVal(amount)
                 temp_found_data[addr][protocol_name] = {  # type: ignore
-                    'amount': str(amount),
+                    'amount': amount,
                     'asset': airdrop_data.asset,
                     'link': airdrop_data.url,
                     'claimed': False,
@@ -395,7 +528,7 @@ def check_airdrops(
                         location_label=string_to_evm_address(addr),
                         asset=airdrop_data.asset,
                         tolerance=FValWithTolerance(
-                            value=FVal(amount),
+                            value=amount_value,
                             tolerance=tolerance_for_amount_check,
                         ),
                     ),
@@ -414,11 +547,11 @@ def check_airdrops(
         found_data[event_tuple[0]][asset_to_protocol[event_tuple[1]]]['claimed'] = True
 
     for protocol_name, poap_airdrop_data in poap_airdrops.items():
-        data_dict = get_poap_airdrop_data(poap_airdrop_data, protocol_name, data_dir)
+        data_dict = jsonloads_dict(files[f'{protocol_name}.json'].read_text(encoding='utf8'))
         for addr, assets in data_dict.items():
             # not doing to_checksum_address() here since the file addresses are checksummed
             # and doing to_checksum_address() so many times hits performance
-            if addr in addresses:
+            if addr in tracked_addresses:
                 if 'poap' not in found_data[addr]:  # type: ignore[index]
                     found_data[addr]['poap'] = []  # type: ignore[index]
 
@@ -124,6 +124,17 @@ def globaldb_set_unique_cache_value(
     )
 
 
+def globaldb_delete_unique_cache_value(
+        write_cursor: DBCursor,
+        key_parts: Iterable[str | UniqueCacheType],
+) -> None:
+    """Delete the entry with the given key from the unique_cache, if it exists"""
+    write_cursor.execute(
+        'DELETE FROM unique_cache WHERE key=?',
+        (compute_cache_key(key_parts),),
+    )
+
+
 def globaldb_get_unique_cache_value(
         cursor: DBCursor,
         key_parts: Iterable[str | UniqueCacheType],
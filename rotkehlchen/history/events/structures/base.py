@@ -1,6 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
 from enum import auto
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, TypedDict, TypeVar
 
 from rotkehlchen.accounting.constants import EVENT_CATEGORY_MAPPINGS
@@ -474,13 +475,23 @@ class HistoryEvent(HistoryBaseEntry):
         return accounting.events_accountant.process(event=self, events_iterator=events_iterator)
 
 
-def get_event_type_identifier(
+@lru_cache(maxsize=1024)  # called for every event processed in accounting
+def _get_event_type_identifier(
         event_type: HistoryEventType,
         event_subtype: HistoryEventSubType,
-        counterparty: str | None = None,
+        counterparty: str | None,
 ) -> int:
     key = f'{event_type.serialize()}{event_subtype.serialize()}'
     if counterparty is not None:
         key += counterparty
 
     return hash(key)
+
+
+def get_event_type_identifier(
+        event_type: HistoryEventType,
+        event_subtype: HistoryEventSubType,
+        counterparty: str | None = None,
+) -> int:
+    """Typed entry point since the lru_cache wrapper accepts any hashable arguments"""
+    return _get_event_type_identifier(event_type, event_subtype, counterparty)
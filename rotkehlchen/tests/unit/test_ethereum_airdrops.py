@@ -1,7 +1,6 @@
-import datetime
 import json
-from copy import deepcopy
 from http import HTTPStatus
+from typing import TYPE_CHECKING
 from unittest.mock import Mock, patch
 
 import pytest
@@ -24,6 +23,7 @@ from rotkehlchen.db.history_events import DBHistoryEvents
 from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.fval import FVal
 from rotkehlchen.globaldb.cache import (
+    compute_cache_key,
     globaldb_get_unique_cache_value,
     globaldb_set_unique_cache_value,
 )
@@ -31,9 +31,13 @@ from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.history.events.structures.evm_event import EvmEvent
 from rotkehlchen.history.events.structures.types import HistoryEventSubType, HistoryEventType
 from rotkehlchen.tests.utils.factories import make_evm_tx_hash
-from rotkehlchen.types import CacheType, Location, TimestampMS
+from rotkehlchen.tests.utils.mock import MockResponse
+from rotkehlchen.types import CacheType, Location, Timestamp, TimestampMS
 from rotkehlchen.utils.serialization import rlk_jsondumps
 
+if TYPE_CHECKING:
+    from rotkehlchen.db.drivers.gevent import DBCursor
+
 TEST_ADDR1 = string_to_evm_address('0x2B888954421b424C5D3D9Ce9bB67c9bD47537d12')
 TEST_ADDR2 = string_to_evm_address('0x51985CE8BB9AB1708746b24e22e37CD7A980Ec24')
 TEST_POAP1 = string_to_evm_address('0x043e2a6047e50710e0f5189DBA7623C4A183F871')
@@ -125,20 +129,52 @@ MOCK_AIRDROP_INDEX = {'airdrops': {
     ],
 }}
 
+MOCK_URL_TO_DATA = {  # contents of the mocked airdrop CSVs and POAP JSONs
+    f'{AIRDROPS_REPO_BASE}/airdrops/uniswap.csv':
+        f'address,uni,is_lp,is_user,is_socks\n{TEST_ADDR1},400,False,True,False\n{TEST_ADDR2},400.050642,True,True,False\n',
+    f'{AIRDROPS_REPO_BASE}/airdrops/1inch.csv':
+        f'address,tokens\n{TEST_ADDR1},630.374421472277638654\n',
+    f'{AIRDROPS_REPO_BASE}/airdrops/shapeshift.csv':
+        f'address,tokens\n{TEST_ADDR1},200\n',
+    f'{AIRDROPS_REPO_BASE}/airdrops/cow_gnosis.csv':
+        f'address,tokens\n{TEST_ADDR1},99807039723201809834\n',
+    f'{AIRDROPS_REPO_BASE}/airdrops/diva.csv':
+        f'address,tokens\n{TEST_ADDR1},84000\n',
+    f'{AIRDROPS_REPO_BASE}/airdrops/grain_iou.csv':
+        f'address,tokens\n{TEST_ADDR2},16301717650649890035791\n',
+    f'{AIRDROPS_REPO_BASE}/airdrops/shutter.csv':
+        f'address,tokens\n{TEST_ADDR2},394857.029384576349787465\n',
+    f'{AIRDROPS_REPO_BASE}/airdrops/invalid.csv':
+        f'address,tokens\n{TEST_ADDR2},123\n{TEST_ADDR2},123\n\n',  # will be skipped because last row is empty  # noqa: E501
+    f'{AIRDROPS_REPO_BASE}/airdrops/poap/poap_aave_v2_pioneers.json':
+        f'{{"{TEST_POAP1}": [\n566\n]}}',
+}
+MOCK_URL_TO_RESPONSE = {
+    url: MockResponse(
+        status_code=HTTPStatus.OK,
+        text=data,
+        headers={'ETag': f'{url.rsplit("/", maxsplit=1)[-1]}_etag'},
+    ) for url, data in MOCK_URL_TO_DATA.items()
+}
+MOCK_CSV_HEADER_RESPONSE = MockResponse(HTTPStatus.OK, 'address,tokens\n')
+
 
-def _mock_airdrop_list(url: str, timeout: int = 0, headers: dict | None = None):  # pylint: disable=unused-argument
+def _mock_airdrop_list(  # pylint: disable=unused-argument
+        url: str,
+        timeout: int = 0,
+        headers: dict | None = None,
+        stream: bool = False,
+):
     mock_response = Mock()
     if url == AIRDROPS_INDEX:
         mock_response.headers = {'ETag': 'etag'}
         mock_response.text = json.dumps(NOT_CSV_WEBPAGE)
         mock_response.json = lambda: NOT_CSV_WEBPAGE
         return mock_response
-    else:  # when CSV is queried, return invalid payload
-        mock_response.text = mock_response.content = '<>invalid CSV<>'
-        return mock_response
+    # when CSV is queried, return invalid payload
+    return MockResponse(HTTPStatus.OK, '<>invalid CSV<>')
 
 
-@pytest.mark.freeze_time()
 @pytest.mark.parametrize('number_of_eth_accounts', [2])
 @pytest.mark.parametrize('use_clean_caching_directory', [True])
 @pytest.mark.parametrize('new_asset_data', [{
@@ -159,7 +195,6 @@ def _mock_airdrop_list(url: str, timeout: int = 0, headers: dict | None = None):
 }])
 @pytest.mark.parametrize('remove_global_assets', [['eip155:1/erc20:0xe485E2f1bab389C08721B291f6b59780feC83Fd7']])  # noqa: E501
 def test_check_airdrops(
-        freezer,
         ethereum_accounts,
         database,
         globaldb,
@@ -179,7 +214,7 @@ def test_check_airdrops(
             event_subtype=HistoryEventSubType.AIRDROP,
             asset=A_UNI,
             balance=Balance(amount=FVal('400') + tolerance_for_amount_check * FVal('0.25')),  # inside tolerance  # noqa: E501
-            location_label=string_to_evm_address(TEST_ADDR1),
+            location_label=TEST_ADDR1,
         ), EvmEvent(
             tx_hash=make_evm_tx_hash(),
             sequence_index=0,
@@ -189,62 +224,58 @@ def test_check_airdrops(
             event_subtype=HistoryEventSubType.AIRDROP,
             asset=A_1INCH,
             balance=Balance(amount=FVal('630.374421472277638654') + tolerance_for_amount_check * FVal('2')),  # outside tolerance  # noqa: E501
-            location_label=string_to_evm_address(TEST_ADDR1),
+            location_label=TEST_ADDR1,
         ),
     ]
     MOCK_AIRDROP_INDEX['airdrops']['shutter']['new_asset_data'] = new_asset_data
-    mock_airdrop_index = deepcopy(MOCK_AIRDROP_INDEX)
+    mock_airdrop_index = {  # only copy the parts that get modified later in the test
+        'airdrops': {
+            **MOCK_AIRDROP_INDEX['airdrops'],
+            'diva': {**MOCK_AIRDROP_INDEX['airdrops']['diva']},
+        },
+        'poap_airdrops': {
+            'aave_v2_pioneers': list(MOCK_AIRDROP_INDEX['poap_airdrops']['aave_v2_pioneers']),
+        },
+    }
 
     new_asset_identifier = MOCK_AIRDROP_INDEX['airdrops']['shutter']['asset_identifier']
-    AssetResolver.assets_cache.clear()  # remove new asset from cache
+    AssetResolver.clean_memory_cache(new_asset_identifier)  # remove new asset from cache
 
     events_db = DBHistoryEvents(database)
     with database.conn.write_ctx() as write_cursor:
         events_db.add_history_events(write_cursor, claim_events)
 
-    def _prepare_mock_response(url: str, update_airdrop_index: bool = False):
+    mock_airdrop_index_text = json.dumps(mock_airdrop_index)
+    mock_airdrop_index_etag = 'etag'
+    remote_responses = MOCK_URL_TO_RESPONSE.copy()
+
+    def _prepare_mock_response(url: str):
         """Mocking the airdrop data is very convenient here because the airdrop data is quite large
         and read timeout errors can happen even with 90secs threshold. Vcr-ing it is not possible
         because the vcr yaml file is above the github limit of 100MB. The schema of AIRDROPS_INDEX
         is checked in the rotki/data repo."""
-        mock_response = Mock()
-        if update_airdrop_index is True:
-            mock_airdrop_index['airdrops']['diva']['csv_hash'] = 'updated_hash'
-            mock_airdrop_index['poap_airdrops']['aave_v2_pioneers'][3] = 'updated_hash'
-            mock_response.headers = {'ETag': 'updated_etag'}
-        url_to_data_map = {
-            AIRDROPS_INDEX: mock_airdrop_index,
-            f'{AIRDROPS_REPO_BASE}/airdrops/uniswap.csv':
-                f'address,uni,is_lp,is_user,is_socks\n{TEST_ADDR1},400,False,True,False\n{TEST_ADDR2},400.050642,True,True,False\n',
-            f'{AIRDROPS_REPO_BASE}/airdrops/1inch.csv':
-                f'address,tokens\n{TEST_ADDR1},630.374421472277638654\n',
-            f'{AIRDROPS_REPO_BASE}/airdrops/shapeshift.csv':
-                f'address,tokens\n{TEST_ADDR1},200\n',
-            f'{AIRDROPS_REPO_BASE}/airdrops/cow_gnosis.csv':
-                f'address,tokens\n{TEST_ADDR1},99807039723201809834\n',
-            f'{AIRDROPS_REPO_BASE}/airdrops/diva.csv':
-                f'address,tokens\n{TEST_ADDR1},84000\n',
-            f'{AIRDROPS_REPO_BASE}/airdrops/grain_iou.csv':
-                f'address,tokens\n{TEST_ADDR2},16301717650649890035791\n',
-            f'{AIRDROPS_REPO_BASE}/airdrops/shutter.csv':
-                f'address,tokens\n{TEST_ADDR2},394857.029384576349787465\n',
-            f'{AIRDROPS_REPO_BASE}/airdrops/invalid.csv':
-                f'address,tokens\n{TEST_ADDR2},123\n{TEST_ADDR2},123\n\n',  # will be skipped because last row is empty  # noqa: E501
-            f'{AIRDROPS_REPO_BASE}/airdrops/poap/poap_aave_v2_pioneers.json':
-                f'{{"{TEST_POAP1}": [\n566\n]}}',
-        }
         if url == AIRDROPS_INDEX:
-            mock_response.text = json.dumps(mock_airdrop_index)
-            mock_response.json = lambda: mock_airdrop_index
-            mock_response.headers = {'ETag': 'etag'}
-        else:
-            mock_response.text = url_to_data_map.get(url, 'address,tokens\n')  # Return the data from the dictionary or just a header if 'url' is not found  # noqa: E501
-            assert isinstance(mock_response.text, str)
-            mock_response.content = mock_response.text.encode('utf-8')
-        return mock_response
-
-    def mock_requests_get(url: str, timeout: int = 0, headers: dict | None = None):  # pylint: disable=unused-argument
-        return _prepare_mock_response(url)
+            return MockResponse(
+                status_code=HTTPStatus.OK,
+                text=mock_airdrop_index_text,
+                headers={'ETag': mock_airdrop_index_etag},
+            )
+        # Return the data for the url or just a header if 'url' is not found
+        return remote_responses.get(url, MOCK_CSV_HEADER_RESPONSE)
+
+    def mock_requests_get(  # pylint: disable=unused-argument
+            url: str,
+            timeout: int = 0,
+            headers: dict | None = None,
+            stream: bool = False,
+    ):
+        response = _prepare_mock_response(url)
+        if (
+            headers is not None and
+            headers.get('If-None-Match') == response.headers.get('ETag', '').encode('utf-8')
+        ):  # the remote file did not change since the cached etag
+            return MockResponse(HTTPStatus.NOT_MODIFIED, '', headers=response.headers)
+        return response
 
     # invalid metadata index is already present
     with globaldb.conn.write_ctx() as write_cursor:
@@ -254,11 +285,30 @@ def test_check_airdrops(
             value='{"metadata": "invalid"}',
         )
 
-    # no CSV hashes are present in the DB
+    # every key that the hashes and ETags of the index and airdrop files can be cached under
+    file_urls = {
+        f'{protocol_name}.csv': f"{AIRDROPS_REPO_BASE}/{airdrop['csv_path']}"
+        for protocol_name, airdrop in MOCK_AIRDROP_INDEX['airdrops'].items()
+    } | {
+        f'{protocol_name}.json': f'{AIRDROPS_REPO_BASE}/{poap_airdrop[0]}'
+        for protocol_name, poap_airdrop in MOCK_AIRDROP_INDEX['poap_airdrops'].items()
+    }
+    airdrop_cache_keys = [compute_cache_key((CacheType.AIRDROPS_HASH, ETAG_CACHE_KEY))]
+    for name in file_urls:
+        airdrop_cache_keys.extend((
+            compute_cache_key((CacheType.AIRDROPS_HASH, name)),
+            compute_cache_key((CacheType.AIRDROPS_HASH, name, ETAG_CACHE_KEY)),
+        ))
+
+    def _get_cached_airdrop_values(cursor: 'DBCursor') -> dict[str, str]:
+        return dict(cursor.execute(
+            f'SELECT key, value FROM unique_cache WHERE key IN ({",".join("?" * len(airdrop_cache_keys))})',  # noqa: E501
+            airdrop_cache_keys,
+        ))
+
+    # no hashes or ETags are present in the DB
     with globaldb.conn.read_ctx() as cursor:
-        assert cursor.execute(
-            'SELECT COUNT(*) FROM unique_cache WHERE key LIKE ?', ('AIRDROPS_HASH%',),
-        ).fetchone()[0] == 0
+        assert _get_cached_airdrop_values(cursor) == {}
 
     # one CSV is already present with invalid content, but no cached hash in DB
     csv_dir = data_dir / APPDIR_NAME / AIRDROPSDIR_NAME
@@ -266,8 +316,6 @@ def test_check_airdrops(
     with open(csv_dir / 'shapeshift.csv', 'w', encoding='utf8') as f:
         f.write('invalid,csv\n')
 
-    # testing just on the cutoff time of shutter
-    freezer.move_to(datetime.datetime.fromtimestamp(1721000000, tz=datetime.UTC))
     with (
         patch('rotkehlchen.chain.ethereum.airdrops.SMALLEST_AIRDROP_SIZE', 1),
         patch('rotkehlchen.chain.ethereum.airdrops.requests.get', side_effect=mock_requests_get),
@@ -284,23 +332,45 @@ def test_check_airdrops(
             database=database,
             data_dir=data_dir,
             tolerance_for_amount_check=tolerance_for_amount_check,
+            current_time=Timestamp(1721000000),  # testing just on the cutoff time of shutter
         )
 
     # invalid metadata index is replaced by the valid one
     with globaldb.conn.read_ctx() as cursor:
-        assert globaldb_get_unique_cache_value(
+        assert json.loads(globaldb_get_unique_cache_value(
             cursor=cursor,
             key_parts=(CacheType.AIRDROPS_METADATA,),
-        ) == json.dumps(MOCK_AIRDROP_INDEX)
+        )) == MOCK_AIRDROP_INDEX
 
-    # new CSV hashes are saved in the DB
+    # the ETag of the index is saved in the DB
     with globaldb.conn.read_ctx() as cursor:
-        assert cursor.execute(
-            'SELECT COUNT(*) FROM unique_cache WHERE key LIKE ?', ('AIRDROPS_HASH%',),
-        ).fetchone()[0] == 10
-        assert cursor.execute(
-            'SELECT value FROM unique_cache WHERE key=?', ('AIRDROPS_HASHdiva.csv',),
-        ).fetchone()[0] == MOCK_AIRDROP_INDEX['airdrops']['diva']['csv_hash']
+        assert globaldb_get_unique_cache_value(
+            cursor=cursor,
+            key_parts=(CacheType.AIRDROPS_HASH, ETAG_CACHE_KEY),
+        ) == 'etag'
+
+    # new file hashes and the ETags of the files that had one are saved in the DB, nothing else
+    expected_hashes = {
+        f'{protocol_name}.csv': airdrop['csv_hash']
+        for protocol_name, airdrop in MOCK_AIRDROP_INDEX['airdrops'].items()
+    } | {
+        f'{protocol_name}.json': poap_airdrop[3]
+        for protocol_name, poap_airdrop in MOCK_AIRDROP_INDEX['poap_airdrops'].items()
+    }
+    with globaldb.conn.read_ctx() as cursor:
+        assert _get_cached_airdrop_values(cursor) == {
+            compute_cache_key((CacheType.AIRDROPS_HASH, ETAG_CACHE_KEY)): 'etag',
+        } | {
+            compute_cache_key((CacheType.AIRDROPS_HASH, name)): file_hash
+            for name, file_hash in expected_hashes.items()
+        } | {
+            compute_cache_key((CacheType.AIRDROPS_HASH, name, ETAG_CACHE_KEY)): MOCK_URL_TO_RESPONSE[url].headers['ETag']  # noqa: E501
+            for name, url in file_urls.items() if url in MOCK_URL_TO_RESPONSE
+        }
+        assert globaldb_get_unique_cache_value(
+            cursor=cursor,
+            key_parts=(CacheType.AIRDROPS_HASH, 'diva.csv', ETAG_CACHE_KEY),
+        ) == 'diva.csv_etag'
 
     # invalid CSV is also, updated
     assert (csv_dir / 'shapeshift.csv').read_text(encoding='utf8') == f'address,tokens\n{TEST_ADDR1},200\n'  # noqa: E501
@@ -357,8 +427,6 @@ def test_check_airdrops(
         'name': 'AAVE V2 Pioneers',
     }]
 
-    # after cutoff time of shutter
-    freezer.move_to(datetime.datetime.fromtimestamp(1721000001, tz=datetime.UTC))
     with (
         patch('rotkehlchen.chain.ethereum.airdrops.SMALLEST_AIRDROP_SIZE', 1),
         patch('rotkehlchen.chain.ethereum.airdrops.requests.get', side_effect=mock_requests_get) as mock_get,  # noqa: E501
@@ -369,18 +437,21 @@ def test_check_airdrops(
             database=database,
             data_dir=data_dir,
             tolerance_for_amount_check=tolerance_for_amount_check,
+            current_time=Timestamp(1721000001),  # after cutoff time of shutter
         )
         assert mock_get.call_count == 1
     assert len(data[TEST_ADDR2]) == 2
     assert 'shutter' not in data[TEST_ADDR2]
 
-    def update_mock_requests_get(url: str, timeout: int = 0, headers: dict | None = None):  # pylint: disable=unused-argument
-        return _prepare_mock_response(url, update_airdrop_index=True)
+    # update the hashes of the diva CSV and aave JSON in the remote index
+    mock_airdrop_index['airdrops']['diva']['csv_hash'] = 'updated_hash'
+    mock_airdrop_index['poap_airdrops']['aave_v2_pioneers'][3] = 'updated_hash'
+    mock_airdrop_index_text = json.dumps(mock_airdrop_index)
+    mock_airdrop_index_etag = 'updated_etag'
 
-    freezer.move_to(datetime.datetime.fromtimestamp(1721000001 + 12 * HOUR_IN_SECONDS, tz=datetime.UTC))  # noqa: E501
     with (
         patch('rotkehlchen.chain.ethereum.airdrops.SMALLEST_AIRDROP_SIZE', 1),
-        patch('rotkehlchen.chain.ethereum.airdrops.requests.get', side_effect=update_mock_requests_get) as mock_get,  # noqa: E501
+        patch('rotkehlchen.chain.ethereum.airdrops.requests.get', side_effect=mock_requests_get) as mock_get,  # noqa: E501
     ):
         data = check_airdrops(
             msg_aggregator=messages_aggregator,
@@ -388,15 +459,78 @@ def test_check_airdrops(
             database=database,
             data_dir=data_dir,
             tolerance_for_amount_check=tolerance_for_amount_check,
+            current_time=Timestamp(1721000001 + 12 * HOUR_IN_SECONDS),
         )
         # diva CSV and aave JSON were queried again because their hashes were updated
         assert mock_get.call_count == 3
 
+    # their content did not change, so the remote returned not modified and local files are kept
+    diva_url = f'{AIRDROPS_REPO_BASE}/airdrops/diva.csv'
+    assert next(
+        call.kwargs['headers'] for call in mock_get.call_args_list
+        if call.kwargs['url'] == diva_url
+    ) == {'If-None-Match': b'diva.csv_etag'}
+    assert (csv_dir / 'diva.csv').read_text(encoding='utf8') == MOCK_URL_TO_DATA[diva_url]
+
     # new CSV hashes are saved in the DB
     with globaldb.conn.read_ctx() as cursor:
-        assert cursor.execute(
-            'SELECT value FROM unique_cache WHERE key=?', ('AIRDROPS_HASHdiva.csv',),
-        ).fetchone()[0] == 'updated_hash'
+        assert globaldb_get_unique_cache_value(
+            cursor=cursor,
+            key_parts=(CacheType.AIRDROPS_HASH, 'diva.csv'),
+        ) == 'updated_hash'
+
+    # update the hashes again, this time together with the remote content. The new diva CSV
+    # comes with a new ETag while the new aave JSON comes with none at all
+    aave_url = f'{AIRDROPS_REPO_BASE}/airdrops/poap/poap_aave_v2_pioneers.json'
+    new_diva_data = f'address,tokens\n{TEST_ADDR2},42000\n'
+    remote_responses[diva_url] = MockResponse(
+        status_code=HTTPStatus.OK,
+        text=new_diva_data,
+        headers={'ETag': 'diva.csv_new_etag'},
+    )
+    remote_responses[aave_url] = MockResponse(HTTPStatus.OK, f'{{"{TEST_POAP1}": [566, 567]}}')
+    mock_airdrop_index['airdrops']['diva']['csv_hash'] = 'new_hash'
+    mock_airdrop_index['poap_airdrops']['aave_v2_pioneers'][3] = 'new_hash'
+    mock_airdrop_index_text = json.dumps(mock_airdrop_index)
+    mock_airdrop_index_etag = 'new_etag'
+    aave_etag_key = (CacheType.AIRDROPS_HASH, 'aave_v2_pioneers.json', ETAG_CACHE_KEY)
+    with globaldb.conn.read_ctx() as cursor:
+        assert globaldb_get_unique_cache_value(cursor=cursor, key_parts=aave_etag_key) is not None
+
+    with (
+        patch('rotkehlchen.chain.ethereum.airdrops.SMALLEST_AIRDROP_SIZE', 1),
+        patch('rotkehlchen.chain.ethereum.airdrops.requests.get', side_effect=mock_requests_get) as mock_get,  # noqa: E501
+    ):
+        data = check_airdrops(
+            msg_aggregator=messages_aggregator,
+            addresses=[TEST_ADDR2, TEST_POAP1],
+            database=database,
+            data_dir=data_dir,
+            tolerance_for_amount_check=tolerance_for_amount_check,
+            current_time=Timestamp(1721000001 + 24 * HOUR_IN_SECONDS),
+        )
+        assert mock_get.call_count == 3
+
+    # the files were downloaded again and replaced the local ones
+    assert (csv_dir / 'diva.csv').read_text(encoding='utf8') == new_diva_data
+    assert data[TEST_ADDR2]['diva'] == {
+        'amount': '42000',
+        'asset': MOCK_AIRDROP_INDEX['airdrops']['diva']['asset_identifier'],
+        'link': 'https://claim.diva.community/',
+        'claimed': False,
+    }
+    assert data[TEST_POAP1]['poap'][0]['assets'] == [566, 567]
+    with globaldb.conn.read_ctx() as cursor:
+        assert globaldb_get_unique_cache_value(
+            cursor=cursor,
+            key_parts=(CacheType.AIRDROPS_HASH, 'diva.csv'),
+        ) == 'new_hash'
+        assert globaldb_get_unique_cache_value(  # the new ETag replaced the old one
+            cursor=cursor,
+            key_parts=(CacheType.AIRDROPS_HASH, 'diva.csv', ETAG_CACHE_KEY),
+        ) == 'diva.csv_new_etag'
+        # the stale ETag was removed since the new response came without one
+        assert globaldb_get_unique_cache_value(cursor=cursor, key_parts=aave_etag_key) is None
 
     # Test cache file and row is created
     for protocol_name in MOCK_AIRDROP_INDEX['airdrops']:
@@ -404,10 +538,10 @@ def test_check_airdrops(
     for protocol_name in MOCK_AIRDROP_INDEX['poap_airdrops']:
         assert (data_dir / APPDIR_NAME / AIRDROPSPOAPDIR_NAME / f'{protocol_name}.json').is_file()
     with GlobalDBHandler().conn.read_ctx() as cursor:
-        assert globaldb_get_unique_cache_value(
+        assert json.loads(globaldb_get_unique_cache_value(
             cursor=cursor,
             key_parts=(CacheType.AIRDROPS_METADATA,),
-        ) == rlk_jsondumps(mock_airdrop_index)
+        )) == mock_airdrop_index
 
 
 @pytest.mark.parametrize('use_clean_caching_directory', [True])
@@ -424,8 +558,11 @@ def test_airdrop_fail(database, data_dir, messages_aggregator):
         )
 
 
-@pytest.mark.parametrize('remote_etag', ['etag', 'updated_etag'])
-@pytest.mark.parametrize('database_etag', [None, 'etag', 'updated_etag'])
+@pytest.mark.parametrize(('remote_etag', 'database_etag'), [
+    ('etag', None),  # nothing cached
+    ('etag', 'etag'),  # cached index is up to date
+    ('updated_etag', 'etag'),  # cached index is outdated
+])
 def test_fetch_airdrops_metadata(database, remote_etag, database_etag):
     if database_etag is not None:
         # if database_etag is present, add those values in DB